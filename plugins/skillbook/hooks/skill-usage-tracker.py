@@ -3,7 +3,8 @@
 Skill Usage Tracker for Skillbook
 Hook type: UserPromptSubmit
 
-Tracks /command and /skill usage, incrementing counters in a stats file.
+Tracks /command and /skill usage, appending increments to a journal that is
+periodically folded into the stats file.
 Supports alias mapping, plugin skill detection, and level-up notifications.
 
 Setup: Add to ~/.claude/settings.json under hooks.UserPromptSubmit:
@@ -14,18 +15,25 @@ Setup: Add to ~/.claude/settings.json under hooks.UserPromptSubmit:
     }]
   }
 
-Requires: Python 3.8+ (no external dependencies)
+The stats file is written as compact JSON; set SKILLBOOK_PRETTY=1 in the
+hook's environment to have it indented for hand-reading instead.
+
+The journal, lock and atomic-write rules live in stats_journal.py, which
+the installer copies next to this file (see _stats_journal).
+
+Requires: Python 3.8+ (no external dependencies; uses orjson if installed)
 """
 
 import json
-import math
 import os
-import re
+import stat
 import sys
-import tempfile
-from datetime import datetime
+import time
 from pathlib import Path
 
+# math and orjson are imported inside the functions that need them: most
+# prompts are not /commands and exit before reaching them.
+
 
 # ---------------------------------------------------------------------------
 # Alias mapping: short command -> canonical skill name
@@ -35,26 +43,93 @@ ALIASES = {
     "wrap": "session-wrap:wrap",
 }
 
+# Raw-payload scan for the prompt's first character (see read_stdin_json)
+_PROMPT_KEY = b'"prompt"'
+_JSON_WS = b" \t\r\n"
+
+# Characters allowed in a /command name (ASCII letters, digits, _ : -)
+_CMD_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_:-"
+)
+
+# Journal events are folded into the canonical stats file once this many
+# have accumulated; until then each use is a single appended line.
+JOURNAL_COMPACT_THRESHOLD = 256
+
+# ~/.claude locations as plain strings; the lookups below use os.path so the
+# per-prompt path stays free of pathlib objects
+HOME = os.path.expanduser("~")
+CLAUDE_DIR = os.path.join(HOME, ".claude")
+COMMANDS_DIR = os.path.join(CLAUDE_DIR, "commands")
+SKILLS_DIR = os.path.join(CLAUDE_DIR, "skills")
+INSTALLED_PLUGINS_PATH = os.path.join(CLAUDE_DIR, "plugins", "installed_plugins.json")
+CONFIG_PATH = os.path.join(CLAUDE_DIR, "skillbook.config.json")
+DEFAULT_STATS_PATH = os.path.join(CLAUDE_DIR, "skillbook-stats.json")
+
+# Plugin install index built from installed_plugins.json:
+#   "key" is (path, st_mtime_ns, st_size), "paths" maps plugin name -> [str]
+_PLUGINS_CACHE = {"key": None, "paths": None}
+
+# Merged stats per file:
+#   str(path) -> ((canonical signature, journal signature), stats, pending)
+_STATS_CACHE = {}
+
+
+def _prompt_may_be_command(raw):
+    """
+    Decide from the raw hook payload whether its prompt could be a /command.
+
+    Inspects the bytes after the "prompt" key without decoding the JSON.
+    Returns False only when that is certain: the key appears exactly once
+    (or not at all) and its string value starts with something other than
+    '/' or a backslash escape. Anything unusual defers to the parser.
+    """
+    start = raw.find(_PROMPT_KEY)
+    if start == -1:
+        return False
+    if raw.find(_PROMPT_KEY, start + 1) != -1:
+        return True  # Repeated or nested key
+
+    i, n = start + len(_PROMPT_KEY), len(raw)
+    while i < n and raw[i] in _JSON_WS:
+        i += 1
+    if i >= n or raw[i] != ord(":"):
+        return True
+    i += 1
+    while i < n and raw[i] in _JSON_WS:
+        i += 1
+    if i >= n or raw[i] != ord('"'):
+        return True  # Not a string value
+    i += 1
+    return i >= n or raw[i] in b"/\\"
+
 
 def read_stdin_json():
-    """Read and parse JSON from stdin (hook input)."""
+    """
+    Read and parse JSON from stdin (hook input).
+
+    Returns None without decoding the payload when the prompt cannot be a
+    /command, which is the case for almost every prompt.
+    """
     try:
-        raw = sys.stdin.read()
+        raw = sys.stdin.buffer.read()
         if not raw.strip():
             return None
+        if not _prompt_may_be_command(raw):
+            return None
         return json.loads(raw)
-    except (json.JSONDecodeError, OSError):
+    except (ValueError, OSError):
         return None
 
 
 def extract_command(prompt):
     """Extract /command from the beginning of the prompt string."""
-    if not prompt:
-        return None
-    match = re.match(r'^/([a-zA-Z0-9_:-]+)', prompt)
-    if not match:
+    if not prompt or prompt[0] != "/":
         return None
-    return match.group(1)
+    i, n = 1, len(prompt)
+    while i < n and prompt[i] in _CMD_CHARS:
+        i += 1
+    return prompt[1:i] or None
 
 
 def resolve_alias(command):
@@ -76,7 +151,7 @@ def validate_stats_path(path_str):
     """
     try:
         path = Path(os.path.expanduser(path_str)).resolve()
-        home_dir = Path.home().resolve()
+        home_dir = Path(HOME).resolve()
         path.relative_to(home_dir)
         return path
     except (ValueError, OSError):
@@ -88,23 +163,60 @@ def get_stats_path():
     Determine the stats file path.
     Priority: config file -> default location.
     """
-    home = Path.home()
-    config_path = home / ".claude" / "skillbook.config.json"
-    default_path = home / ".claude" / "skillbook-stats.json"
-
-    if config_path.exists():
-        try:
-            with open(config_path, "r") as f:
-                cfg = json.load(f)
-            raw = cfg.get("statsFile", "")
-            if raw:
-                validated = validate_stats_path(raw)
-                if validated:
-                    return validated
-        except (OSError, json.JSONDecodeError, TypeError):
-            pass
+    try:
+        with open(CONFIG_PATH, "r") as f:
+            cfg = json.load(f)
+        raw = cfg.get("statsFile", "")
+        if raw:
+            validated = validate_stats_path(raw)
+            if validated:
+                return validated
+    except (OSError, json.JSONDecodeError, TypeError):
+        pass
+
+    return Path(DEFAULT_STATS_PATH)
+
+
+def _index_plugins(plugins_data):
+    """Map each plugin name (key before '@') to its install paths."""
+    paths = {}
+    plugins = plugins_data.get("plugins", {})
+    if not isinstance(plugins, dict):
+        return paths
+    for key, entries in plugins.items():
+        plugin_name, sep, _version = key.partition("@")
+        if not sep or not isinstance(entries, list):
+            continue
+        for entry in entries:
+            install_path = entry.get("installPath", "") if isinstance(entry, dict) else ""
+            if install_path:
+                paths.setdefault(plugin_name, []).append(install_path)
+    return paths
+
+
+def _load_installed_plugins(path):
+    """
+    Return the plugin name -> install paths index, or None if unavailable.
 
-    return default_path
+    The index is built from installed_plugins.json and cached while the
+    file's (mtime, size) signature is unchanged.
+    """
+    sig = _stat_signature(path)
+    if sig is None:
+        return None
+    key = (path,) + sig
+    if _PLUGINS_CACHE["key"] == key:
+        return _PLUGINS_CACHE["paths"]
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    _PLUGINS_CACHE["key"] = key
+    _PLUGINS_CACHE["paths"] = _index_plugins(data)
+    return _PLUGINS_CACHE["paths"]
 
 
 def check_skill_exists(name):
@@ -116,151 +228,220 @@ def check_skill_exists(name):
       2. ~/.claude/skills/<name>/SKILL.md
       3. Installed plugin skills (plugin:skill or plugin format)
     """
-    home = Path.home()
-    commands_dir = home / ".claude" / "commands"
-    skills_dir = home / ".claude" / "skills"
-    plugins_dir = home / ".claude" / "plugins"
-    installed_plugins_path = plugins_dir / "installed_plugins.json"
-
     # 1. commands/*.md
-    if (commands_dir / (name + ".md")).is_file():
+    if os.path.isfile(os.path.join(COMMANDS_DIR, name + ".md")):
         return True
 
     # 2. skills/*/SKILL.md
-    if (skills_dir / name / "SKILL.md").is_file():
+    if os.path.isfile(os.path.join(SKILLS_DIR, name, "SKILL.md")):
         return True
 
     # 3. Plugin skills
-    if installed_plugins_path.is_file():
-        try:
-            with open(installed_plugins_path, "r") as f:
-                plugins_data = json.load(f)
-        except (OSError, json.JSONDecodeError):
-            return False
+    plugin_paths = _load_installed_plugins(INSTALLED_PLUGINS_PATH)
+    if plugin_paths:
+        # Parse plugin:skill format once (skill_name is "" without a colon)
+        plugin_name, _sep, skill_name = name.partition(":")
 
-        plugins = plugins_data.get("plugins", {})
-        if not isinstance(plugins, dict):
-            return False
+        # Install paths of plugins keyed plugin_name@<marketplace>
+        for p in plugin_paths.get(plugin_name, ()):
+            # Root SKILL.md
+            if os.path.isfile(os.path.join(p, "SKILL.md")):
+                return True
 
-        # Parse plugin:skill format
-        if ":" in name:
-            plugin_name = name.split(":")[0]
-            skill_name = name.split(":", 1)[1]
-        else:
-            plugin_name = name
-            skill_name = ""
-
-        for key, entries in plugins.items():
-            # Match plugin key that starts with plugin_name@
-            if not key.startswith(plugin_name + "@"):
-                continue
-            if not isinstance(entries, list):
-                continue
-            for entry in entries:
-                install_path = entry.get("installPath", "")
-                if not install_path:
-                    continue
-                p = Path(install_path)
-
-                # Root SKILL.md
-                if (p / "SKILL.md").is_file():
-                    return True
-
-                # skills/{skill_name}/SKILL.md
-                if skill_name and (p / "skills" / skill_name / "SKILL.md").is_file():
-                    return True
-
-                # skills/{plugin_name}/SKILL.md
-                if (p / "skills" / plugin_name / "SKILL.md").is_file():
-                    return True
+            # skills/{skill_name}/SKILL.md
+            if skill_name and os.path.isfile(os.path.join(p, "skills", skill_name, "SKILL.md")):
+                return True
+
+            # skills/{plugin_name}/SKILL.md
+            if os.path.isfile(os.path.join(p, "skills", plugin_name, "SKILL.md")):
+                return True
 
     return False
 
 
+def _stat_signature(path):
+    """Return (st_mtime_ns, st_size) for path, or None if it is not a file."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _stats_journal():
+    """
+    Return the shared stats_journal module (journal format, lock, writes).
+
+    The installer copies stats_journal.py next to this hook. When it is
+    missing there, the copy in the skill directory is used: skills/skillbook/
+    beside hooks/ in the repo, or the installed ~/.claude/skills/skillbook/.
+    Raises ImportError if none is found.
+    """
+    try:
+        import stats_journal
+    except ImportError:
+        here = os.path.dirname(os.path.abspath(__file__))
+        for skill_dir in (
+            os.path.join(os.path.dirname(here), "skills", "skillbook"),
+            os.path.join(SKILLS_DIR, "skillbook"),
+        ):
+            if os.path.isfile(os.path.join(skill_dir, "stats_journal.py")):
+                sys.path.append(skill_dir)
+                break
+        import stats_journal
+    return stats_journal
+
+
 def load_stats(stats_path):
-    """Load existing stats or return a fresh structure."""
-    if stats_path.is_file():
+    """
+    Load stats with any journaled increments replayed on top.
+
+    Returns (stats, pending) where pending is the number of journal events
+    not yet folded into the canonical file. The merged dict is cached per
+    path and reused while both files' (mtime, size) signatures are
+    unchanged. Callers own the returned dict; update_stats and
+    compact_stats keep the cache in step with what was written.
+    """
+    stats_journal = _stats_journal()
+    key = str(stats_path)
+    canonical_sig = _stat_signature(key)
+
+    cached = _STATS_CACHE.get(key)
+    if cached is not None and cached[0][0] == canonical_sig:
+        gen = cached[1].get("journalGen", 0)
+        if _stat_signature(str(stats_journal.journal_path(stats_path, gen))) == cached[0][1]:
+            return cached[1], cached[2]
+
+    stats = None
+    if canonical_sig is not None:
         try:
-            with open(stats_path, "r") as f:
-                return json.load(f)
+            with open(key, "r") as f:
+                stats = json.load(f)
         except (OSError, json.JSONDecodeError):
             pass
-    return {"version": 1, "totalUses": 0, "skills": {}}
+    if not isinstance(stats, dict):
+        stats = {"version": 1, "totalUses": 0, "skills": {}}
+
+    journal_sig = _stat_signature(str(stats_journal.journal_path(stats_path, stats.get("journalGen", 0))))
+    pending = stats_journal.replay_journal(stats, stats_path) if journal_sig is not None else 0
+
+    _STATS_CACHE[key] = ((canonical_sig, journal_sig), stats, pending)
+    return stats, pending
+
+
+def _today():
+    """Return the local date as YYYY-MM-DD."""
+    t = time.localtime()
+    return "{:04d}-{:02d}-{:02d}".format(t.tm_year, t.tm_mon, t.tm_mday)
 
 
 def calculate_level(uses):
-    """Calculate skill level from usage count."""
+    """Calculate skill level from usage count: max(1, floor(sqrt(uses * 10)))."""
     if uses <= 0:
         return 0
-    return max(1, int(math.sqrt(uses * 10)))
+    from math import isqrt
 
+    return max(1, isqrt(uses * 10))
 
-def write_stats_atomic(stats_path, stats):
-    """
-    Write stats to file atomically.
-    Uses a temporary file + rename to prevent data corruption on crash.
-    Sets file permissions to 0600 (owner read/write only) for security.
+
+def _encode_stats(stats):
+    """Serialize stats to newline-terminated UTF-8 JSON bytes.
+
+    Compact by default; indented when SKILLBOOK_PRETTY=1.
     """
-    stats_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write to a temp file in the same directory, then rename
-    fd, tmp_path = tempfile.mkstemp(
-        dir=str(stats_path.parent),
-        prefix=".skillbook-stats-",
-        suffix=".tmp",
-    )
     try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
-            f.write("\n")
-
-        # Set secure permissions (owner read/write only)
-        os.chmod(tmp_path, 0o600)
+        import orjson
+    except ImportError:  # Optional: faster stats encoding
+        orjson = None
 
-        os.replace(tmp_path, str(stats_path))
-    except OSError:
-        # Clean up temp file on failure
+    pretty = os.environ.get("SKILLBOOK_PRETTY") == "1"
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
         try:
-            os.unlink(tmp_path)
-        except OSError:
-            pass
-        raise
+            return orjson.dumps(stats, option=option)
+        except TypeError:
+            pass  # e.g. an integer beyond 64 bits; the stdlib handles it
+    if pretty:
+        text = json.dumps(stats, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(stats, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
 
 
-def update_stats(name, stats_path):
+def compact_stats(stats_path, stats):
     """
-    Increment usage counter for the given skill and write to disk.
-    Returns (old_level, new_level) for level-up detection.
+    Fold the journal into the canonical stats file (stats_journal.compact).
+
+    stats must already include every journaled event. The file is written
+    atomically and durably with 0600 permissions; the cached copy is
+    dropped first so a failed write never leaves it stale.
     """
-    stats = load_stats(stats_path)
+    stats_journal = _stats_journal()
+    key = str(stats_path)
+    _STATS_CACHE.pop(key, None)
 
-    skills = stats.get("skills", {})
-    if name not in skills:
-        skills[name] = {"uses": 0, "lastUsed": None, "pinned": False}
+    stats_journal.compact(stats_path, stats, _encode_stats)
 
-    old_level = calculate_level(skills[name]["uses"])
+    sig = _stat_signature(key)
+    if sig is not None:
+        new_journal = str(stats_journal.journal_path(stats_path, stats["journalGen"]))
+        _STATS_CACHE[key] = ((sig, _stat_signature(new_journal)), stats, 0)
 
-    # Create updated skill entry (immutable pattern)
-    today = datetime.now().strftime("%Y-%m-%d")
-    updated_skill = {
-        **skills[name],
-        "uses": skills[name]["uses"] + 1,
-        "lastUsed": today,
-    }
-    updated_skills = {**skills, name: updated_skill}
 
-    updated_stats = {
-        **stats,
-        "skills": updated_skills,
-        "totalUses": stats.get("totalUses", 0) + 1,
-        "lastUpdated": today,
-    }
+def update_stats(name, stats_path):
+    """
+    Increment usage counter for the given skill and record it on disk.
+    Returns (old_level, new_level) for level-up detection.
 
-    new_level = calculate_level(updated_skill["uses"])
+    The increment is appended to the journal; the canonical stats file is
+    only rewritten when the journal reaches JOURNAL_COMPACT_THRESHOLD
+    events, or on first use so the stats file exists. Levels follow
+    sqrt(uses) and move on most early uses, so a level-up is journaled
+    like any other use; readers derive levels from the replayed counts.
 
-    write_stats_atomic(stats_path, updated_stats)
+    The whole load -> update -> write cycle runs under the stats lock
+    shared with skillbook.py, so no increment is lost to a last-writer-wins
+    rename or to a journal being retired underneath an append.
+    """
+    stats_journal = _stats_journal()
+    lock_fd = stats_journal.lock_stats(stats_path)
+    try:
+        stats, pending = load_stats(stats_path)
 
-    return old_level, new_level
+        # stats is mutated in place below; forget the cached copy until the
+        # change is on disk so a failed write cannot leave it stale
+        key = str(stats_path)
+        _STATS_CACHE.pop(key, None)
+
+        entry = stats.setdefault("skills", {}).setdefault(
+            name, {"uses": 0, "lastUsed": None, "pinned": False}
+        )
+        old_level = calculate_level(entry.get("uses", 0))
+
+        today = _today()
+        uses = entry.get("uses", 0) + 1
+        entry["uses"] = uses
+        entry["lastUsed"] = today
+        stats["totalUses"] = stats.get("totalUses", 0) + 1
+        stats["lastUpdated"] = today
+
+        # The level only moves once uses * 10 reaches (old_level + 1) ** 2
+        if uses * 10 >= (old_level + 1) ** 2:
+            new_level = calculate_level(uses)
+        else:
+            new_level = old_level
+
+        if "journalGen" not in stats or pending + 1 >= JOURNAL_COMPACT_THRESHOLD:
+            compact_stats(stats_path, stats)
+        else:
+            journal_sig = stats_journal.append_event(stats_path, name, today, stats["journalGen"])
+            _STATS_CACHE[key] = ((_stat_signature(key), journal_sig), stats, pending + 1)
+
+        return old_level, new_level
+    finally:
+        stats_journal.unlock_stats(lock_fd)
 
 
 def main():
@@ -291,7 +472,7 @@ def main():
     # 6. Update stats and check for level-up
     try:
         old_level, new_level = update_stats(command, stats_path)
-    except OSError:
+    except (OSError, ImportError):
         return
 
     # 7. Level-up notification
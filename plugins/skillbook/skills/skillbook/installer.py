@@ -11,19 +11,25 @@ Handles:
   - Clean uninstall (with optional --purge)
 
 Usage:
-  python3 installer.py install
+  python3 installer.py install [--link]
   python3 installer.py uninstall [--purge]
   python3 installer.py status
 """
 
+import errno
 import json
 import os
-import shutil
+import re
 import stat
 import sys
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+from stats_journal import replay_journal, write_atomic
+
+# shutil and datetime are imported inside the functions that need them:
+# `status` (the common case) never copies files or takes a timestamp.
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -32,6 +38,7 @@ HOME = Path.home()
 CLAUDE_DIR = HOME / ".claude"
 SETTINGS_FILE = CLAUDE_DIR / "settings.json"
 CONFIG_FILE = CLAUDE_DIR / "skillbook.config.json"
+PARSE_CACHE_FILE = CLAUDE_DIR / ".skillbook_parse_cache.json"
 
 SKILL_INSTALL_DIR = CLAUDE_DIR / "skills" / "skillbook"
 HOOKS_DIR = CLAUDE_DIR / "hooks"
@@ -40,11 +47,20 @@ HOOK_FILENAME = "skill-usage-tracker.py"
 HOOK_INSTALL_PATH = HOOKS_DIR / HOOK_FILENAME
 HOOK_COMMAND = "python3 ~/.claude/hooks/skill-usage-tracker.py"
 
+# Shared journal/lock/write module the Python hook imports from its own dir
+HOOK_MODULE_FILENAME = "stats_journal.py"
+
 # Patterns that identify a skillbook hook in settings.json
 HOOK_DETECT_PATTERNS = ("skill-usage-tracker", "command-usage-tracker")
+_HOOK_PATTERN_RE = re.compile("|".join(map(re.escape, HOOK_DETECT_PATTERNS)))
 
-# Files/dirs to skip when copying skill files
-SKIP_PATTERNS = {"__pycache__", ".pyc"}
+# Files/dirs to skip when copying skill files: exact names and suffixes
+SKIP_PATTERNS = frozenset({"__pycache__"})
+_SKIP_SUFFIXES = (".pyc", ".pyo")
+
+# Interpreter check, fixed for the life of the process
+_PYTHON_OK = sys.version_info[:2] >= (3, 8)
+_PYTHON_VERSION_STR = "{}.{}.{}".format(*sys.version_info[:3])
 
 DEFAULT_CONFIG = {
     "statsFile": "~/.claude/skillbook-stats.json",
@@ -52,34 +68,92 @@ DEFAULT_CONFIG = {
     "language": "en",
 }
 
+# DEFAULT_CONFIG is constant, so its file contents are encoded once
+_DEFAULT_CONFIG_BYTES = (
+    json.dumps(DEFAULT_CONFIG, indent=2, ensure_ascii=False) + "\n"
+).encode("utf-8")
+
+# Parsed settings.json per (path, st_mtime_ns, st_size); a run reads the
+# file from several steps, so it is only decoded again after it changes
+_SETTINGS_CACHE = {}
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Status lines go straight to sys.stdout.write (looked up per call so a
+# replaced stdout is honoured); print()'s sep/end handling is not needed
+
 def _print_ok(msg):
-    print(f"  [OK] {msg}")
+    sys.stdout.write(f"  [OK] {msg}\n")
 
 
 def _print_fail(msg):
-    print(f"  [!!] {msg}")
+    sys.stdout.write(f"  [!!] {msg}\n")
 
 
 def _print_skip(msg):
-    print(f"  [--] {msg}")
+    sys.stdout.write(f"  [--] {msg}\n")
 
 
 def _print_info(msg):
-    print(f"  ... {msg}")
+    sys.stdout.write(f"  ... {msg}\n")
 
 
 def _timestamp():
+    from datetime import datetime
+
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
 def _should_skip(name):
     """Return True if file/directory name should be skipped during copy."""
-    return name in SKIP_PATTERNS or name.endswith(".pyc")
+    return name in SKIP_PATTERNS or name.endswith(_SKIP_SUFFIXES)
+
+
+def _fast_copytree(src, dst, skip=None, link=False):
+    """Copy the src tree into dst (merging into existing directories).
+
+    Walks each directory with a single os.scandir pass and copies files with
+    shutil.copyfile, which uses the kernel fast paths (sendfile /
+    copy_file_range / fcopyfile) where available. Permission bits are
+    copied as with shutil.copytree; timestamps are not. Entries whose name
+    matches skip(name) are pruned before descending into them.
+
+    With link=True each file is hardlinked instead, falling back to a copy
+    when the filesystem refuses (cross-device, no hardlink support).
+    """
+    import shutil
+
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        entries = list(it)
+    for entry in entries:
+        if skip is not None and skip(entry.name):
+            continue
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir():
+            _fast_copytree(entry.path, target, skip, link)
+            continue
+        # Replace rather than write through: the old file may be a hardlink
+        # from a previous --link install that shares the source's inode
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+        if link:
+            try:
+                os.link(entry.path, target)
+                continue
+            except OSError as exc:
+                if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                    raise
+        shutil.copyfile(entry.path, target)
+        shutil.copymode(entry.path, target)
+    # Directory mode last, as copytree does, so a read-only source dir
+    # does not block filling the copy
+    shutil.copymode(src, dst)
 
 
 def _validate_stats_path(path_str):
@@ -108,26 +182,28 @@ def _validate_stats_path(path_str):
     return path
 
 
+@lru_cache(maxsize=None)
 def _resolve_source_dir():
     """Return the skill source directory (where this installer.py lives).
 
+    Resolved once per process; an error is re-raised on every call.
+
     Raises:
         RuntimeError: If the source directory is a symbolic link.
     """
-    source = Path(__file__)
-
-    # Check for symbolic link attack
-    if source.is_symlink():
+    # Check for symbolic link attack (lstat: the link itself, not its target)
+    if stat.S_ISLNK(os.lstat(__file__).st_mode):
         raise RuntimeError(
             f"Security: installer.py is a symbolic link.\n"
             f"         This may indicate a malicious setup."
         )
 
-    return source.resolve().parent
+    return Path(__file__).resolve().parent
 
 
+@lru_cache(maxsize=None)
 def _resolve_hook_source():
-    """Return the path to the hook file in the repo.
+    """Return the path to the hook file in the repo (cached per process).
 
     Looks for the Python hook first, then falls back to .sh.
     The repo structure is:
@@ -151,9 +227,20 @@ def _read_settings():
     On success: (settings_dict, None)
     On file-not-found: ({}, None)
     On parse error: (None, error_message)
+
+    Results are cached until the file's mtime or size changes.
     """
-    if not SETTINGS_FILE.exists():
+    try:
+        st = SETTINGS_FILE.stat()
+    except FileNotFoundError:
         return {}, None
+    except OSError as exc:
+        return None, f"Cannot read {SETTINGS_FILE}: {exc}"
+
+    key = (SETTINGS_FILE, st.st_mtime_ns, st.st_size)
+    cached = _SETTINGS_CACHE.get(key)
+    if cached is not None:
+        return cached
 
     try:
         text = SETTINGS_FILE.read_text(encoding="utf-8")
@@ -161,34 +248,69 @@ def _read_settings():
         return None, f"Cannot read {SETTINGS_FILE}: {exc}"
 
     if not text.strip():
-        return {}, None
+        result = ({}, None)
+    else:
+        try:
+            result = (json.loads(text), None)
+        except json.JSONDecodeError as exc:
+            result = (None, (
+                f"Malformed JSON in {SETTINGS_FILE} (line {exc.lineno}).\n"
+                f"  Fix the file manually, then retry installation."
+            ))
+    _SETTINGS_CACHE[key] = result
+    return result
+
+
+def _encode_settings(data):
+    """Serialize settings to indented, newline-terminated UTF-8 JSON bytes.
 
+    Uses orjson if installed (same layout as json.dumps(indent=2)), falling
+    back to the stdlib for anything orjson rejects.
+    """
     try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
-        return None, (
-            f"Malformed JSON in {SETTINGS_FILE} (line {exc.lineno}).\n"
-            f"  Fix the file manually, then retry installation."
-        )
-    return data, None
+        import orjson
+    except ImportError:  # Optional: faster settings encoding
+        orjson = None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def _write_settings(data):
-    """Write settings dict to settings.json with validation round-trip."""
-    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    text = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
-    SETTINGS_FILE.write_text(text, encoding="utf-8")
+    """Write settings dict to settings.json atomically.
 
-    # Validate by re-reading
-    reloaded = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-    if reloaded != data:
-        raise RuntimeError("settings.json validation failed after write")
+    Uses stats_journal.write_atomic (the hook's O_EXCL temp file, fsync,
+    rename and directory fsync), so a crash or a concurrent installer never
+    leaves a truncated settings.json. A symlinked settings.json is written
+    through (its target is replaced) and an existing file keeps its
+    permission bits.
+    """
+    _SETTINGS_CACHE.clear()
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    target = os.path.realpath(SETTINGS_FILE)
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = None
+    write_atomic(target, _encode_settings(data), mode)
 
 
 def _backup_settings():
-    """Create a timestamped backup of settings.json. Returns backup path or None."""
+    """Create a timestamped backup of settings.json. Returns backup path or None.
+
+    The backup is a real copy, not a hardlink: a link shares the inode, so
+    a failed write or an in-place edit of settings.json would change the
+    backup too.
+    """
     if not SETTINGS_FILE.exists():
         return None
+
+    import shutil
+
     backup = SETTINGS_FILE.with_name(f"settings.json.bak.{_timestamp()}")
     shutil.copy2(SETTINGS_FILE, backup)
     return backup
@@ -199,19 +321,35 @@ def _find_hook_indices(settings):
 
     Returns list of (index, command_string) tuples.
     """
-    hooks_section = settings.get("hooks", {})
-    user_prompt_hooks = hooks_section.get("UserPromptSubmit", [])
+    # `x or ()` only builds a fallback when the key is missing or empty,
+    # unlike a .get() default which is evaluated on every call
+    hooks_section = settings.get("hooks") or {}
+    user_prompt_hooks = hooks_section.get("UserPromptSubmit") or ()
     matches = []
 
     for i, entry in enumerate(user_prompt_hooks):
-        for hook in entry.get("hooks", []):
+        for hook in entry.get("hooks") or ():
             cmd = hook.get("command", "")
-            if any(pattern in cmd for pattern in HOOK_DETECT_PATTERNS):
+            if _HOOK_PATTERN_RE.search(cmd):
                 matches.append((i, cmd))
                 break
     return matches
 
 
+def _has_hook(settings):
+    """Return True if any UserPromptSubmit entry is a skillbook hook.
+
+    Stops at the first match; use _find_hook_indices when the positions
+    are needed.
+    """
+    hooks_section = settings.get("hooks") or {}
+    for entry in hooks_section.get("UserPromptSubmit") or ():
+        for hook in entry.get("hooks") or ():
+            if _HOOK_PATTERN_RE.search(hook.get("command", "")):
+                return True
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Core Functions
 # ---------------------------------------------------------------------------
@@ -222,15 +360,12 @@ def check_python_version():
     Returns:
         True if version is sufficient, False otherwise.
     """
-    major, minor = sys.version_info[:2]
-    version_str = f"{major}.{minor}.{sys.version_info[2]}"
-
-    if (major, minor) >= (3, 8):
-        _print_ok(f"Python {version_str}")
+    if _PYTHON_OK:
+        _print_ok(f"Python {_PYTHON_VERSION_STR}")
         return True
 
     _print_fail(
-        f"Python 3.8+ required. You have Python {version_str}.\n"
+        f"Python 3.8+ required. You have Python {_PYTHON_VERSION_STR}.\n"
         f"         Please upgrade: https://www.python.org/downloads/"
     )
     return False
@@ -243,24 +378,25 @@ def detect_existing_install():
         dict with keys: skill_files, hook_file, hook_registered, config_exists
     """
     result = {
-        "skill_files": SKILL_INSTALL_DIR.exists()
-            and (SKILL_INSTALL_DIR / "skillbook.py").exists(),
-        "hook_file": HOOK_INSTALL_PATH.exists(),
+        "skill_files": os.path.exists(SKILL_INSTALL_DIR / "skillbook.py"),
+        "hook_file": os.path.exists(HOOK_INSTALL_PATH),
         "hook_registered": False,
-        "config_exists": CONFIG_FILE.exists(),
+        "config_exists": os.path.exists(CONFIG_FILE),
     }
 
     settings, err = _read_settings()
     if settings is not None:
-        result["hook_registered"] = len(_find_hook_indices(settings)) > 0
+        result["hook_registered"] = _has_hook(settings)
 
     return result
 
 
-def copy_skill_files():
+def copy_skill_files(link=False):
     """Copy skill files from the repo to ~/.claude/skills/skillbook/.
 
-    Creates a timestamped backup if skill files already exist.
+    Creates a timestamped backup if skill files already exist. With
+    link=True files are hardlinked to the repo copy where possible, so
+    updating the repo updates the installed skill.
 
     Returns:
         True on success, False on failure.
@@ -276,14 +412,14 @@ def copy_skill_files():
         # Backup existing installation
         if SKILL_INSTALL_DIR.exists() and (SKILL_INSTALL_DIR / "skillbook.py").exists():
             backup_dir = SKILL_INSTALL_DIR.with_name(f"skillbook.bak.{_timestamp()}")
-            shutil.copytree(SKILL_INSTALL_DIR, backup_dir)
+            _fast_copytree(SKILL_INSTALL_DIR, backup_dir)
             _print_info(f"Backup: {backup_dir}")
 
-        shutil.copytree(
+        _fast_copytree(
             source_dir,
             SKILL_INSTALL_DIR,
-            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-            dirs_exist_ok=True,
+            skip=_should_skip,
+            link=link,
         )
         _print_ok(f"Skill files      {SKILL_INSTALL_DIR}/")
         return True
@@ -295,6 +431,9 @@ def copy_skill_files():
 def copy_hook_file():
     """Copy the hook file to ~/.claude/hooks/ and set executable.
 
+    The Python hook gets stats_journal.py copied next to it, since it
+    imports the journal format, lock and write rules from there.
+
     Returns:
         True on success, False on failure.
     """
@@ -313,10 +452,20 @@ def copy_hook_file():
         dest_name = f"skill-usage-tracker{source_hook.suffix}"
         dest_path = HOOKS_DIR / dest_name
 
-        shutil.copy2(source_hook, dest_path)
+        import shutil
+
+        # Contents only: the mode is set below and timestamps don't matter,
+        # so copy2's copystat (utime/chmod/xattrs) is skipped
+        shutil.copyfile(source_hook, dest_path)
 
         # Set executable permission (owner only)
-        dest_path.chmod(0o755)
+        os.chmod(dest_path, 0o755)
+
+        if source_hook.suffix == ".py":
+            shutil.copyfile(
+                _resolve_source_dir() / HOOK_MODULE_FILENAME,
+                HOOKS_DIR / HOOK_MODULE_FILENAME,
+            )
 
         _print_ok(f"Hook file        {dest_path}")
         return True
@@ -333,7 +482,7 @@ def merge_settings_json():
       2. Read current settings (handle missing/empty)
       3. Check for duplicate hook (pattern-based)
       4. Append or update hook entry
-      5. Write with validation
+      5. Write settings.json
 
     Returns:
         True on success, False on failure.
@@ -375,36 +524,25 @@ def merge_settings_json():
         ]
     }
 
+    # settings is edited in place; _write_settings drops the cached copy
+    hooks_section = settings.setdefault("hooks", {})
+    user_prompt_hooks = hooks_section.setdefault("UserPromptSubmit", [])
+
     # If there are old skillbook hooks with a different command, update them
     if existing:
-        hooks_section = settings.get("hooks", {})
-        old_hooks = hooks_section.get("UserPromptSubmit", [])
-        update_indices = {idx for idx, _ in existing}
-
-        user_prompt_hooks = [
-            new_hook_entry if i in update_indices else entry
-            for i, entry in enumerate(old_hooks)
-        ]
-
-        settings = {**settings, "hooks": {**hooks_section, "UserPromptSubmit": user_prompt_hooks}}
+        for idx, _cmd in existing:
+            user_prompt_hooks[idx] = new_hook_entry
         _print_ok(f"Hook updated     settings.json (UserPromptSubmit)")
     else:
         # Append new hook
-        hooks_section = settings.get("hooks", {})
-        user_prompt_hooks = list(hooks_section.get("UserPromptSubmit", []))
         user_prompt_hooks.append(new_hook_entry)
-
-        settings = {
-            **settings,
-            "hooks": {**hooks_section, "UserPromptSubmit": user_prompt_hooks},
-        }
         _print_ok(f"Hook registered  settings.json (UserPromptSubmit)")
 
-    # Write and validate
+    # Write
     try:
         _write_settings(settings)
         return True
-    except (OSError, RuntimeError) as exc:
+    except OSError as exc:
         _print_fail(f"Failed to write settings.json: {exc}")
         return False
 
@@ -415,14 +553,13 @@ def create_default_config():
     Returns:
         True always (config creation is optional).
     """
-    if CONFIG_FILE.exists():
+    if os.path.lexists(CONFIG_FILE):
         _print_skip("Config already exists, keeping your settings")
         return True
 
     try:
         CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        text = json.dumps(DEFAULT_CONFIG, indent=2, ensure_ascii=False) + "\n"
-        CONFIG_FILE.write_text(text, encoding="utf-8")
+        CONFIG_FILE.write_bytes(_DEFAULT_CONFIG_BYTES)
         _print_ok(f"Config           {CONFIG_FILE}")
         return True
     except OSError as exc:
@@ -442,8 +579,7 @@ def verify_installation():
     all_ok = True
 
     # 1. Skill files
-    skill_main = SKILL_INSTALL_DIR / "skillbook.py"
-    if skill_main.exists():
+    if os.path.exists(SKILL_INSTALL_DIR / "skillbook.py"):
         _print_ok(f"Skill files      {SKILL_INSTALL_DIR}/")
     else:
         _print_fail(f"Skill files      {SKILL_INSTALL_DIR}/ (missing)")
@@ -453,7 +589,7 @@ def verify_installation():
     hook_found = False
     for ext in (".py", ".sh"):
         hook_path = HOOKS_DIR / f"skill-usage-tracker{ext}"
-        if hook_path.exists():
+        if os.path.exists(hook_path):
             is_exec = os.access(hook_path, os.X_OK)
             if is_exec:
                 _print_ok(f"Hook file        {hook_path}")
@@ -472,25 +608,23 @@ def verify_installation():
         _print_fail(f"settings.json    {err}")
         all_ok = False
     else:
-        hooks = _find_hook_indices(settings)
-        if hooks:
+        if _has_hook(settings):
             _print_ok("Hook registered  settings.json (UserPromptSubmit)")
         else:
             _print_fail("Hook registered  Not found in settings.json")
             all_ok = False
 
     # 4. Config file
-    if CONFIG_FILE.exists():
+    if os.path.exists(CONFIG_FILE):
         _print_ok(f"Config           {CONFIG_FILE}")
     else:
         _print_skip(f"Config           {CONFIG_FILE} (optional, not created)")
 
     # 5. Python version
-    major, minor, micro = sys.version_info[:3]
-    if (major, minor) >= (3, 8):
-        _print_ok(f"Python 3.8+      Python {major}.{minor}.{micro}")
+    if _PYTHON_OK:
+        _print_ok(f"Python 3.8+      Python {_PYTHON_VERSION_STR}")
     else:
-        _print_fail(f"Python 3.8+      Python {major}.{minor}.{micro} (too old)")
+        _print_fail(f"Python 3.8+      Python {_PYTHON_VERSION_STR} (too old)")
         all_ok = False
 
     return all_ok
@@ -500,9 +634,12 @@ def verify_installation():
 # Orchestrators
 # ---------------------------------------------------------------------------
 
-def install():
+def install(link=False):
     """Run the full installation sequence.
 
+    Args:
+        link: If True, hardlink skill files instead of copying them.
+
     Steps:
       1. Check Python version
       2. Copy skill files
@@ -520,7 +657,7 @@ def install():
         sys.exit(1)
 
     # Step 2: Copy skill files
-    if not copy_skill_files():
+    if not copy_skill_files(link=link):
         print("\n  Installation failed at: copy skill files")
         sys.exit(1)
 
@@ -559,6 +696,7 @@ def uninstall(purge=False):
       - All of the above
       - Remove ~/.claude/skills/skillbook/ directory
       - Remove ~/.claude/skillbook.config.json
+      - Remove the dashboard's ~/.claude/.skillbook_parse_cache.json
       - Stats file is NEVER deleted
 
     Args:
@@ -581,58 +719,60 @@ def uninstall(purge=False):
             if backup_path:
                 _print_info(f"Backup: {backup_path}")
 
-            hooks_section = settings.get("hooks", {})
-            user_prompt_hooks = list(hooks_section.get("UserPromptSubmit", []))
+            # Edit settings in place; _write_settings drops the cached copy
+            hooks_section = settings["hooks"]
+            user_prompt_hooks = hooks_section["UserPromptSubmit"]
 
-            # Remove in reverse order to preserve indices
-            for idx, cmd in sorted(existing, key=lambda x: x[0], reverse=True):
+            # Remove in reverse order to preserve indices (existing is ascending)
+            for idx, cmd in reversed(existing):
                 user_prompt_hooks.pop(idx)
                 removed.append(f"Hook entry: {cmd}")
 
             # Clean up empty structures
-            if user_prompt_hooks:
-                updated_hooks = {**hooks_section, "UserPromptSubmit": user_prompt_hooks}
-            else:
-                updated_hooks = {
-                    k: v for k, v in hooks_section.items()
-                    if k != "UserPromptSubmit"
-                }
-
-            if updated_hooks:
-                updated_settings = {**settings, "hooks": updated_hooks}
-            else:
-                updated_settings = {k: v for k, v in settings.items() if k != "hooks"}
+            if not user_prompt_hooks:
+                del hooks_section["UserPromptSubmit"]
+            if not hooks_section:
+                del settings["hooks"]
 
             try:
-                _write_settings(updated_settings)
+                _write_settings(settings)
                 _print_ok("Hook removed from settings.json")
-            except (OSError, RuntimeError) as exc:
+            except OSError as exc:
                 _print_fail(f"Failed to update settings.json: {exc}")
         else:
             _print_skip("No skillbook hook found in settings.json")
 
-    # 2. Remove hook file(s)
-    for ext in (".py", ".sh"):
-        hook_path = HOOKS_DIR / f"skill-usage-tracker{ext}"
-        if hook_path.exists():
+    # 2. Remove hook file(s) and the module the Python hook imports
+    hook_paths = [HOOKS_DIR / f"skill-usage-tracker{ext}" for ext in (".py", ".sh")]
+    hook_paths.append(HOOKS_DIR / HOOK_MODULE_FILENAME)
+    for hook_path in hook_paths:
+        if os.path.lexists(hook_path):
             try:
                 hook_path.unlink()
                 removed.append(f"Hook file: {hook_path}")
                 _print_ok(f"Removed {hook_path}")
             except OSError as exc:
                 _print_fail(f"Failed to remove {hook_path}: {exc}")
+    # Bytecode Python cached when the hook imported the module
+    for cached in (HOOKS_DIR / "__pycache__").glob("stats_journal.*.pyc"):
+        try:
+            cached.unlink()
+        except OSError:
+            pass
 
     # 3. Purge: remove skill files and config
     if purge:
         if SKILL_INSTALL_DIR.exists():
             try:
+                import shutil
+
                 shutil.rmtree(SKILL_INSTALL_DIR)
                 removed.append(f"Skill directory: {SKILL_INSTALL_DIR}")
                 _print_ok(f"Removed {SKILL_INSTALL_DIR}/")
             except OSError as exc:
                 _print_fail(f"Failed to remove skill directory: {exc}")
 
-        if CONFIG_FILE.exists():
+        if os.path.lexists(CONFIG_FILE):
             try:
                 CONFIG_FILE.unlink()
                 removed.append(f"Config: {CONFIG_FILE}")
@@ -640,6 +780,14 @@ def uninstall(purge=False):
             except OSError as exc:
                 _print_fail(f"Failed to remove config: {exc}")
 
+        if os.path.lexists(PARSE_CACHE_FILE):
+            try:
+                PARSE_CACHE_FILE.unlink()
+                removed.append(f"Parse cache: {PARSE_CACHE_FILE}")
+                _print_ok(f"Removed {PARSE_CACHE_FILE}")
+            except OSError as exc:
+                _print_fail(f"Failed to remove parse cache: {exc}")
+
         # Explicit reminder: stats are preserved
         stats_path = _find_stats_path()
         if stats_path.exists():
@@ -658,13 +806,12 @@ def uninstall(purge=False):
 
 def _find_stats_path():
     """Find the stats file path from config or default."""
-    if CONFIG_FILE.exists():
+    if os.path.lexists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, encoding="utf-8") as f:
-                cfg = json.load(f)
-            if "statsFile" in cfg:
+            cfg = json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+            if isinstance(cfg, dict) and "statsFile" in cfg:
                 return _validate_stats_path(cfg["statsFile"])
-        except (OSError, json.JSONDecodeError, ValueError):
+        except (OSError, json.JSONDecodeError, TypeError, ValueError):
             pass
     return CLAUDE_DIR / "skillbook-stats.json"
 
@@ -680,6 +827,7 @@ def status():
         try:
             with open(stats_path, encoding="utf-8") as f:
                 data = json.load(f)
+            replay_journal(data, stats_path)
             total = data.get("totalUses", 0)
             skill_count = len(data.get("skills", {}))
             _print_info(f"Stats: {skill_count} skills tracked, {total} total uses")
@@ -707,6 +855,7 @@ def main():
     if not args:
         print("Usage: python3 installer.py [install|uninstall|status]")
         print("  install             Install skillbook (hooks, config, files)")
+        print("  install --link      Same, hardlinking skill files to this repo")
         print("  uninstall           Remove hooks (keep skill files)")
         print("  uninstall --purge   Remove hooks + skill files (keep stats)")
         print("  status              Show installation health")
@@ -715,7 +864,7 @@ def main():
     command = args[0].lower()
 
     if command == "install":
-        install()
+        install(link="--link" in args)
     elif command == "uninstall":
         purge = "--purge" in args
         uninstall(purge=purge)
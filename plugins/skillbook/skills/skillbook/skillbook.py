@@ -5,14 +5,20 @@ Usage: python skillbook.py [dashboard|terminal|stats|pin <skill>|use <skill>|ins
 """
 
 import json
-import math
 import os
 import re
-import subprocess
 import sys
-from datetime import datetime, timedelta
+import time
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
 
+from stats_journal import compact, lock_stats, replay_journal, unlock_stats
+
+# subprocess, math and datetime are imported inside the functions that need
+# them: only the dashboard command spawns a process, and stats dates come
+# from time.strftime. re stays here for the precompiled _CATEGORY_RE.
+
 # Paths
 HOME = Path.home()
 CLAUDE_DIR = HOME / ".claude"
@@ -36,7 +42,7 @@ def _validate_user_path(path_str):
 def _default_stats():
     return {
         "version": 1,
-        "lastUpdated": datetime.now().strftime("%Y-%m-%d"),
+        "lastUpdated": time.strftime("%Y-%m-%d"),
         "totalUses": 0,
         "skills": {},
     }
@@ -91,15 +97,48 @@ CATEGORIES = {
     "misc": {"icon": "\u2728", "name": "Misc", "keywords": []},
 }
 
+# One pattern for all keyword checks: each category is a lookahead branch
+# tried in CATEGORIES order, so the first category with any keyword in the
+# name wins (not the leftmost keyword); the empty named group reports which
+_CATEGORY_RE = re.compile("|".join(
+    "(?=.*?(?:%s))(?P<%s>)" % ("|".join(map(re.escape, cat_info["keywords"])), cat_id)
+    for cat_id, cat_info in CATEGORIES.items()
+    if cat_id != "misc" and cat_info.get("keywords")
+), re.DOTALL)
+
+
+def _loads_json(raw):
+    """Decode JSON bytes, using orjson if installed"""
+    try:
+        import orjson
+    except ImportError:  # Optional: faster JSON decoding
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
+def _encode_stats(stats):
+    """Serialize stats to UTF-8 JSON bytes in the json.dump(indent=2) layout"""
+    try:
+        import orjson
+    except ImportError:  # Optional: faster stats encoding
+        orjson = None
+
+    if orjson is not None:
+        try:
+            return orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(stats, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 def load_stats():
-    """Load stats from JSON file"""
+    """Load stats from JSON file, including journaled hook increments"""
+    stats = None
     if STATS_FILE.exists():
         try:
-            with open(STATS_FILE) as f:
-                return json.load(f)
+            stats = _loads_json(STATS_FILE.read_bytes())
         except json.JSONDecodeError as e:
-            backup = STATS_FILE.with_name(f"{STATS_FILE.name}.corrupt-{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            backup = STATS_FILE.with_name(f"{STATS_FILE.name}.corrupt-{time.strftime('%Y%m%d_%H%M%S')}")
             try:
                 STATS_FILE.rename(backup)
                 print(f"⚠️  Corrupt stats file moved to: {backup}", file=sys.stderr)
@@ -108,29 +147,33 @@ def load_stats():
             print(f"⚠️  Failed to parse stats JSON ({STATS_FILE}:{e.lineno}). Resetting stats.", file=sys.stderr)
         except OSError as e:
             print(f"⚠️  Cannot read stats file {STATS_FILE}: {e}", file=sys.stderr)
-    return _default_stats()
+    if stats is None:
+        stats = _default_stats()
+    replay_journal(stats, STATS_FILE)
+    return stats
 
 
 def save_stats(stats):
-    """Save stats to JSON file"""
-    stats["lastUpdated"] = datetime.now().strftime("%Y-%m-%d")
-    STATS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(STATS_FILE, "w") as f:
-        json.dump(stats, f, indent=2, ensure_ascii=False)
+    """Save stats to JSON file, folding in (and retiring) the hook journal"""
+    stats["lastUpdated"] = time.strftime("%Y-%m-%d")
+    compact(STATS_FILE, stats, _encode_stats)
+
+
+# Rarity by usage count: _RARITY_STRS[i] applies from _RARITY_THRESHOLDS[i - 1] uses
+_RARITY_THRESHOLDS = (1, 5, 20, 50, 100)
+_RARITY_STRS = ("\u2753",) + tuple("\u2b50" * n for n in range(1, 6))
 
 
 def get_rarity(uses):
     """Get rarity stars based on usage count"""
-    if uses >= 100: return "\u2b50\u2b50\u2b50\u2b50\u2b50"
-    if uses >= 50: return "\u2b50\u2b50\u2b50\u2b50"
-    if uses >= 20: return "\u2b50\u2b50\u2b50"
-    if uses >= 5: return "\u2b50\u2b50"
-    if uses >= 1: return "\u2b50"
-    return "\u2753"
+    return _RARITY_STRS[bisect_right(_RARITY_THRESHOLDS, uses)]
 
 
+@lru_cache(maxsize=None)
 def calc_level(uses):
     """Calculate level from usage count: Level = floor(sqrt(uses * 10))"""
+    import math
+
     return max(1, int(math.sqrt(uses * 10))) if uses > 0 else 0
 
 
@@ -139,9 +182,13 @@ def format_last_used(date_str):
     if not date_str:
         return "Never"
     try:
-        date = datetime.strptime(date_str, "%Y-%m-%d")
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        diff = (today - date).days
+        from datetime import date
+
+        # Fixed "YYYY-MM-DD" layout: slice and int() instead of strptime
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError(date_str)
+        day = date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        diff = date.today().toordinal() - day.toordinal()
         if diff == 0: return "Today"
         if diff == 1: return "Yesterday"
         if diff < 7: return f"{diff}d ago"
@@ -151,102 +198,144 @@ def format_last_used(date_str):
         return date_str
 
 
+# The description lives in the frontmatter, so only this many lines (from at
+# most the first DESCRIPTION_READ_BYTES of the file) are scanned
+DESCRIPTION_SCAN_LINES = 40
+DESCRIPTION_READ_BYTES = 4096
+
+
+def _extract_description(lines):
+    """Return the short description from the first lines of a SKILL.md.
+
+    Finds the "description:" line (the value may start on the next
+    non-blank line), drops an opening quote, stops at the next quote and
+    keeps the first sentence, capped at 40 characters.
+    """
+    value = None
+    for i, line in enumerate(lines):
+        if i >= DESCRIPTION_SCAN_LINES:
+            break
+        if value is None:
+            stripped = line.lstrip()
+            if not stripped.startswith("description:"):
+                continue
+            value = stripped[len("description:"):].strip()
+        else:
+            value = line.strip()
+        if value:
+            break
+
+    if not value:
+        return ""
+    if value[0] in "\"'":
+        value = value[1:]
+    for quote in "\"'":
+        value = value.split(quote, 1)[0]
+    return value.split(".")[0][:40]
+
+
 def parse_skill_md(skill_file):
-    """Parse SKILL.md file and extract metadata"""
+    """Parse SKILL.md file and extract metadata (None if the file is missing)"""
     try:
-        with open(skill_file) as f:
-            content = f.read()
-
-        description = ""
-        match = re.search(r'description:\s*["\']?([^"\'\n]+)', content)
-        if match:
-            desc = match.group(1)
-            desc = desc.split('.')[0][:40]
-            description = desc
-
-        return {"description": description}
-    except (OSError, UnicodeDecodeError):
+        # One raw read of the head; no buffered/text file objects needed
+        fd = os.open(skill_file, os.O_RDONLY)
+        try:
+            head = os.read(fd, DESCRIPTION_READ_BYTES)
+        finally:
+            os.close(fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
         return {"description": ""}
 
+    text = head.decode("utf-8", "replace")
+    return {"description": _extract_description(text.splitlines())}
+
+
+def _home_relative(path):
+    """Return path as "~/..." when it is under HOME, else as a plain string"""
+    path = str(path)
+    home = str(HOME)
+    if path.startswith(home + os.sep):
+        return "~/" + path[len(home) + 1:]
+    return path
+
+
+def _scandir(path):
+    """List a directory's entries with one os.scandir pass ([] if unreadable)"""
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _skill_record(name, info, source, path, **extra):
+    """Build the record every scanner emits for one skill"""
+    record = {
+        "name": name,
+        "description": info.get("description", ""),
+        "source": source,
+    }
+    record.update(extra)
+    record["path"] = _home_relative(path)
+    return record
+
+
+def _scan_skill_dirs(root):
+    """Yield (DirEntry, parsed SKILL.md) for each <root>/<name>/SKILL.md skill dir.
+
+    One os.scandir pass; DirEntry.is_dir() answers from readdir's d_type
+    (still following symlinked skill dirs), and opening SKILL.md doubles as
+    the existence check.
+    """
+    for entry in _scandir(root):
+        if entry.is_dir():
+            info = parse_skill_md(os.path.join(entry.path, "SKILL.md"))
+            if info is not None:
+                yield entry, info
+
 
 def scan_local_skills():
     """Scan ~/.claude/skills/ directory"""
-    skills = {}
-    if not SKILLS_DIR.exists():
-        return skills
-
-    for skill_dir in SKILLS_DIR.iterdir():
-        if skill_dir.is_dir():
-            skill_file = skill_dir / "SKILL.md"
-            if skill_file.exists():
-                name = skill_dir.name
-                info = parse_skill_md(skill_file)
-                skills[name] = {
-                    "name": name,
-                    "description": info.get("description", ""),
-                    "source": "local",
-                    "path": "~/" + str(skill_dir.relative_to(HOME))
-                }
-    return skills
+    return {
+        entry.name: _skill_record(entry.name, info, "local", entry.path)
+        for entry, info in _scan_skill_dirs(SKILLS_DIR)
+    }
 
 
 def scan_plugin_skills():
     """Scan installed plugins for skills"""
     skills = {}
-    if not INSTALLED_PLUGINS_FILE.exists():
-        return skills
-
     try:
-        with open(INSTALLED_PLUGINS_FILE) as f:
-            installed = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        installed = _loads_json(INSTALLED_PLUGINS_FILE.read_bytes())
+    except (OSError, ValueError):
         return skills
 
     for plugin_name, installs in installed.get("plugins", {}).items():
+        base_plugin = plugin_name.split("@")[0]
         for install in installs:
             install_path = Path(install.get("installPath", ""))
-            if not install_path.exists():
-                continue
 
-            skills_dir = install_path / "skills"
-            if skills_dir.exists():
-                for skill_dir in skills_dir.iterdir():
-                    if skill_dir.is_dir():
-                        skill_file = skill_dir / "SKILL.md"
-                        if skill_file.exists():
-                            base_plugin = plugin_name.split("@")[0]
-                            skill_name = skill_dir.name
-                            full_name = f"{base_plugin}:{skill_name}" if skill_name != base_plugin else base_plugin
-
-                            info = parse_skill_md(skill_file)
-                            try:
-                                rel_path = "~/" + str(skill_dir.relative_to(HOME))
-                            except ValueError:
-                                rel_path = str(skill_dir)
-                            skills[full_name] = {
-                                "name": full_name,
-                                "description": info.get("description", ""),
-                                "source": "plugin",
-                                "plugin": plugin_name,
-                                "path": rel_path
-                            }
-
-            root_skill = install_path / "SKILL.md"
-            if root_skill.exists():
-                base_plugin = plugin_name.split("@")[0]
-                info = parse_skill_md(root_skill)
-                if base_plugin not in skills:
-                    try:
-                        rel_path = "~/" + str(install_path.relative_to(HOME))
-                    except ValueError:
-                        rel_path = str(install_path)
-                    skills[base_plugin] = {
-                        "name": base_plugin,
-                        "description": info.get("description", ""),
-                        "source": "plugin",
-                        "plugin": plugin_name,
-                        "path": rel_path
-                    }
+            # One listing of the install dir answers both "is there a root
+            # SKILL.md" and "is there a skills/ dir" (missing dir -> no entries)
+            root_skill = None
+            skills_dir = None
+            for entry in _scandir(install_path):
+                if entry.name == "SKILL.md":
+                    root_skill = entry.path
+                elif entry.name == "skills" and entry.is_dir():
+                    skills_dir = entry.path
+
+            if skills_dir:
+                for entry, info in _scan_skill_dirs(skills_dir):
+                    skill_name = entry.name
+                    full_name = f"{base_plugin}:{skill_name}" if skill_name != base_plugin else base_plugin
+                    skills[full_name] = _skill_record(full_name, info, "plugin", entry.path, plugin=plugin_name)
+
+            info = parse_skill_md(root_skill) if root_skill else None
+            if info is not None and base_plugin not in skills:
+                skills[base_plugin] = _skill_record(base_plugin, info, "plugin", install_path, plugin=plugin_name)
 
     return skills
 
@@ -254,133 +343,101 @@ def scan_plugin_skills():
 def scan_commands():
     """Scan ~/.claude/commands/ directory for .md slash commands"""
     skills = {}
-    if not COMMANDS_DIR.exists():
-        return skills
-
-    for cmd_file in COMMANDS_DIR.iterdir():
-        if cmd_file.is_file() and cmd_file.suffix == ".md":
-            name = cmd_file.stem
-            info = parse_skill_md(cmd_file)
-            skills[name] = {
-                "name": name,
-                "description": info.get("description", ""),
-                "source": "command",
-                "path": "~/" + str(cmd_file.relative_to(HOME))
-            }
+    for entry in _scandir(COMMANDS_DIR):
+        name, ext = os.path.splitext(entry.name)
+        if ext == ".md" and entry.is_file():
+            info = parse_skill_md(entry.path)
+            if info is not None:
+                skills[name] = _skill_record(name, info, "command", entry.path)
     return skills
 
 
 def scan_project_skills():
     """Scan current project's .claude/skills/ directory"""
-    skills = {}
-    cwd = Path.cwd()
-    project_skills_dir = cwd / ".claude" / "skills"
-
-    if not project_skills_dir.exists():
-        return skills
-
-    for skill_dir in project_skills_dir.iterdir():
-        if skill_dir.is_dir():
-            skill_file = skill_dir / "SKILL.md"
-            if skill_file.exists():
-                name = skill_dir.name
-                info = parse_skill_md(skill_file)
-                try:
-                    rel_path = "~/" + str(skill_dir.relative_to(HOME))
-                except ValueError:
-                    rel_path = str(skill_dir)
-                skills[f"project:{name}"] = {
-                    "name": name,
-                    "description": info.get("description", ""),
-                    "source": "project",
-                    "path": rel_path
-                }
-    return skills
+    project_skills_dir = os.path.join(os.getcwd(), ".claude", "skills")
+    return {
+        f"project:{entry.name}": _skill_record(entry.name, info, "project", entry.path)
+        for entry, info in _scan_skill_dirs(project_skills_dir)
+    }
 
 
 def scan_all_skills():
     """Scan all skill sources and merge (local > commands > plugins > project)"""
     all_skills = {}
-
-    local = scan_local_skills()
-    all_skills.update(local)
-
-    commands = scan_commands()
-    for name, info in commands.items():
-        if name not in all_skills:
-            all_skills[name] = info
-
-    plugins = scan_plugin_skills()
-    for name, info in plugins.items():
-        if name not in all_skills:
-            all_skills[name] = info
-
-    project = scan_project_skills()
-    for name, info in project.items():
-        if name not in all_skills:
-            all_skills[name] = info
-
+    # The first source to claim a name keeps it
+    for skills in (scan_local_skills(), scan_commands(), scan_plugin_skills(), scan_project_skills()):
+        for name, info in skills.items():
+            all_skills.setdefault(name, info)
     return all_skills
 
 
+@lru_cache(maxsize=None)
 def get_category(skill_name):
-    """Get category for a skill based on keywords"""
-    skill_lower = skill_name.lower()
-
-    for cat_id, cat_info in CATEGORIES.items():
-        if cat_id == "misc":
-            continue
-        for keyword in cat_info.get("keywords", []):
-            if keyword in skill_lower:
-                return cat_id, cat_info
+    """Get category for a skill based on keywords (memoized per name)"""
+    match = _CATEGORY_RE.match(skill_name.lower())
+    if match:
+        return match.lastgroup, CATEGORIES[match.lastgroup]
 
     return "misc", CATEGORIES["misc"]
 
 
-def render_compact(num, skill_name, skill_info, stats_info):
+# Shared read-only stand-in for skills without a stats entry
+_NO_STATS = {}
+
+_SOURCE_ICON = {"local": "", "plugin": "\U0001f50c", "project": "\U0001f4c2", "command": "\U0001f4dc"}
+_COMPACT_LINE = "  %s /%-24s Lv.%2s %3sx %s%s"
+
+
+def render_compact(skill_name, skill_info, stats_info):
     """Render compact card (one line)"""
     uses = stats_info.get("uses", 0)
-    rarity = get_rarity(uses)
-    level = calc_level(uses)
     pinned = "[P]" if stats_info.get("pinned") else ""
-    source = skill_info.get("source", "")
-    source_icon = {"local": "", "plugin": "\U0001f50c", "project": "\U0001f4c2", "command": "\U0001f4dc"}.get(source, "")
-
-    display_name = skill_name[:24]
-    return f"  {rarity} /{display_name:<24} Lv.{level:>2} {uses:>3}x {source_icon}{pinned}"
-
+    source_icon = _SOURCE_ICON.get(skill_info.get("source", ""), "")
+    return _COMPACT_LINE % (get_rarity(uses), skill_name[:24], calc_level(uses), uses, source_icon, pinned)
 
-def render_category_header(cat_id, cat_info, skills_in_cat, stats):
-    """Render category header"""
-    total = len(skills_in_cat)
-    used = len([s for s in skills_in_cat if stats.get("skills", {}).get(s, {}).get("uses", 0) > 0])
-    total_level = sum(calc_level(stats.get("skills", {}).get(s, {}).get("uses", 0)) for s in skills_in_cat)
 
+def render_category_header(cat_info, total, used, total_level):
+    """Render category header from precomputed skill/used counts and level sum"""
     return f"\n{cat_info['icon']} {cat_info['name']} ({used}/{total}) Lv.{total_level}"
 
 
 def render_stats_summary(skills, stats):
     """Render stats summary"""
+    skill_stats = stats.get("skills", {})
     total_skills = len(skills)
-    discovered = len([s for s in skills if stats.get("skills", {}).get(s, {}).get("uses", 0) > 0])
-    total_uses = sum(s.get("uses", 0) for s in stats.get("skills", {}).values())
-    total_level = sum(calc_level(s.get("uses", 0)) for s in stats.get("skills", {}).values())
-
-    local_count = len([s for s in skills.values() if s.get("source") == "local"])
-    command_count = len([s for s in skills.values() if s.get("source") == "command"])
-    plugin_count = len([s for s in skills.values() if s.get("source") == "plugin"])
-    project_count = len([s for s in skills.values() if s.get("source") == "project"])
-
-    skill_items = stats.get("skills", {}).items()
-    most_used = max(skill_items, key=lambda x: x[1].get("uses", 0)) if skill_items else ("None", {"uses": 0})
-    most_used_name = most_used[0]
-    most_used_count = most_used[1].get("uses", 0)
 
+    # One pass over the scanned skills: discovered count and per-source counts
+    discovered = 0
+    source_counts = {}
+    for name, info in skills.items():
+        source = info.get("source")
+        source_counts[source] = source_counts.get(source, 0) + 1
+        if skill_stats.get(name, _NO_STATS).get("uses", 0) > 0:
+            discovered += 1
+    local_count = source_counts.get("local", 0)
+    command_count = source_counts.get("command", 0)
+    plugin_count = source_counts.get("plugin", 0)
+    project_count = source_counts.get("project", 0)
+
+    # One pass over the usage stats: total uses, total level, rarity counts
+    # and the most used skill (first one wins ties, as max() did)
+    most_used_name = None
+    most_used_count = 0
+    total_uses = 0
+    total_level = 0
     rarity_dist = {"\u2b50\u2b50\u2b50\u2b50\u2b50": 0, "\u2b50\u2b50\u2b50\u2b50": 0, "\u2b50\u2b50\u2b50": 0, "\u2b50\u2b50": 0, "\u2b50": 0}
-    for s in stats.get("skills", {}).values():
-        r = get_rarity(s.get("uses", 0))
+    for name, s in skill_stats.items():
+        uses = s.get("uses", 0)
+        if most_used_name is None or uses > most_used_count:
+            most_used_name = name
+            most_used_count = uses
+        total_uses += uses
+        total_level += calc_level(uses)
+        r = get_rarity(uses)
         if r in rarity_dist:
             rarity_dist[r] += 1
+    if most_used_name is None:
+        most_used_name = "None"
 
     w = 55
     lines = [
@@ -416,7 +473,7 @@ def increment_usage(skill_name, stats):
 
     old_level = calc_level(stats["skills"][skill_name]["uses"])
     stats["skills"][skill_name]["uses"] += 1
-    stats["skills"][skill_name]["lastUsed"] = datetime.now().strftime("%Y-%m-%d")
+    stats["skills"][skill_name]["lastUsed"] = time.strftime("%Y-%m-%d")
     stats["totalUses"] = stats.get("totalUses", 0) + 1
     new_level = calc_level(stats["skills"][skill_name]["uses"])
 
@@ -433,7 +490,7 @@ def main(args=None):
     # Install/uninstall/status subcommands (handled before dashboard/terminal routing)
     if args and args[0].lower() == "install":
         from installer import install
-        install()
+        install(link="--link" in args)
         return
 
     if args and args[0].lower() == "uninstall":
@@ -454,6 +511,8 @@ def main(args=None):
     elif not args or args[0].lower() in ["dashboard", "dash", "visual", "web"]:
         dashboard_script = Path(__file__).parent / "skillbook_dashboard.py"
         if dashboard_script.exists():
+            import subprocess
+
             subprocess.run([sys.executable, str(dashboard_script)])
         else:
             print(f"\u274c Dashboard script not found at {dashboard_script}", file=sys.stderr)
@@ -463,7 +522,8 @@ def main(args=None):
     stats = load_stats()
     skills = scan_all_skills()
 
-    for skill_name in stats.get("skills", {}).keys():
+    skill_stats = stats.get("skills", {})
+    for skill_name in skill_stats:
         if skill_name not in skills:
             skills[skill_name] = {"name": skill_name, "description": "", "source": "stats"}
 
@@ -496,12 +556,24 @@ def main(args=None):
                     filter_cat = cat_id
                     break
 
+    if pin_skill_name or add_usage:
+        # Reload under the lock so a concurrent hook append is not lost when
+        # save_stats retires the journal
+        lock_fd = lock_stats(STATS_FILE)
+        try:
+            stats = load_stats()
+            if pin_skill_name:
+                result = pin_skill(pin_skill_name, stats)
+            else:
+                result = increment_usage(add_usage, stats)
+        finally:
+            unlock_stats(lock_fd)
+
     if pin_skill_name:
-        print(pin_skill(pin_skill_name, stats))
+        print(result)
         return
 
     if add_usage:
-        result = increment_usage(add_usage, stats)
         if result:
             print(result)
         else:
@@ -512,53 +584,79 @@ def main(args=None):
         print(render_stats_summary(skills, stats))
         return
 
-    all_skills = sorted(skills.keys())
-    skill_nums = {s: i+1 for i, s in enumerate(all_skills)}
-
     output = []
 
     if pinned_only:
         output.append("\n\U0001f4cc Pinned Skills")
         output.append("\u2501" * 50)
-        for skill_name in all_skills:
-            stats_info = stats.get("skills", {}).get(skill_name, {})
+        for skill_name in sorted(skills):
+            stats_info = skill_stats.get(skill_name, _NO_STATS)
             if stats_info.get("pinned"):
-                output.append(render_compact(skill_nums[skill_name], skill_name, skills[skill_name], stats_info))
+                output.append(render_compact(skill_name, skills[skill_name], stats_info))
     else:
+        # Classify each skill once, tallying per-category used count and
+        # level sum for the headers, then sort each (small) bucket by name
+        cat_buckets = {cat_id: [] for cat_id in CATEGORIES}
+        cat_used = dict.fromkeys(CATEGORIES, 0)
+        cat_level = dict.fromkeys(CATEGORIES, 0)
+        for s in skills:
+            cat_id = get_category(s)[0]
+            cat_buckets[cat_id].append(s)
+            uses = skill_stats.get(s, _NO_STATS).get("uses", 0)
+            if uses > 0:
+                cat_used[cat_id] += 1
+                cat_level[cat_id] += calc_level(uses)
+        for names in cat_buckets.values():
+            names.sort()
+
         for cat_id, cat_info in CATEGORIES.items():
             if filter_cat and cat_id != filter_cat:
                 continue
 
-            skills_in_cat = [s for s in all_skills if get_category(s)[0] == cat_id]
+            skills_in_cat = cat_buckets[cat_id]
             if not skills_in_cat:
                 continue
 
             if not show_all:
-                used_skills = [s for s in skills_in_cat if stats.get("skills", {}).get(s, {}).get("uses", 0) > 0]
+                used_skills = [s for s in skills_in_cat if skill_stats.get(s, _NO_STATS).get("uses", 0) > 0]
                 if not used_skills:
                     continue
                 skills_to_show = used_skills
             else:
                 skills_to_show = skills_in_cat
 
-            output.append(render_category_header(cat_id, cat_info, skills_in_cat, stats))
+            output.append(render_category_header(cat_info, len(skills_in_cat), cat_used[cat_id], cat_level[cat_id]))
 
             for skill_name in skills_to_show:
-                stats_info = stats.get("skills", {}).get(skill_name, {})
-                output.append(render_compact(skill_nums[skill_name], skill_name, skills.get(skill_name, {"description": ""}), stats_info))
+                stats_info = skill_stats.get(skill_name, _NO_STATS)
+                output.append(render_compact(skill_name, skills.get(skill_name, {"description": ""}), stats_info))
 
     if not show_stats and not pinned_only:
         total = len(skills)
-        used_count = len([s for s in skills if stats.get("skills", {}).get(s, {}).get("uses", 0) > 0])
-        local_count = len([s for s in skills.values() if s.get("source") == "local"])
-        command_count = len([s for s in skills.values() if s.get("source") == "command"])
-        plugin_count = len([s for s in skills.values() if s.get("source") == "plugin"])
+        used_count = 0
+        source_counts = {}
+        for name, info in skills.items():
+            source = info.get("source")
+            source_counts[source] = source_counts.get(source, 0) + 1
+            if skill_stats.get(name, _NO_STATS).get("uses", 0) > 0:
+                used_count += 1
+        local_count = source_counts.get("local", 0)
+        command_count = source_counts.get("command", 0)
+        plugin_count = source_counts.get("plugin", 0)
         if used_only:
             output.append(f"\n\U0001f4a1 Discovered: {used_count} | /skillbook for all")
         else:
             output.append(f"\n\U0001f4a1 Local: {local_count} | Commands: {command_count} | Plugins: {plugin_count} | Used: {used_count}/{total}")
 
-    print("\n".join(output))
+    # Encode once and hand the bytes straight to the binary stdout buffer
+    text = "\n".join(output) + "\n"
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(text)
+    else:
+        sys.stdout.flush()
+        out.write(text.encode("utf-8"))
+        out.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,191 @@
+"""
+Skillbook stats journal - the one definition of how the stats file is
+journaled, locked and written. Used by the usage hook, skillbook.py, the
+dashboard and the installer; the installer copies it next to the hook.
+
+The hook appends one JSON line per /command use to a journal next to the
+stats file instead of rewriting it (append_event):
+
+    <stats file>.<journalGen>.journal.jsonl    {"n": "<skill>", "t": "YYYY-MM-DD"}
+
+and now and then folds the journal into the stats file (compact), bumping
+"journalGen" so the retired journal is never replayed twice. Every reader
+of the stats file must replay the current journal on top of it
+(replay_journal) to see the true counts.
+
+Writers serialize on an exclusive lock of the sibling <stats>.lock file
+(lock_stats / unlock_stats), so no increment is lost between a load and
+the write that follows it, and replace files with write_atomic.
+"""
+
+import json
+import os
+from itertools import count
+
+# Per-process sequence for temp file names (see write_atomic)
+_TMP_COUNTER = count()
+
+
+def journal_path(stats_path, gen):
+    """Return the append-only journal path for a stats file generation."""
+    return stats_path.with_name(f"{stats_path.name}.{gen}.journal.jsonl")
+
+
+def replay_journal(stats, stats_path):
+    """Apply the journaled increments to stats in place.
+
+    Uses the journal of the generation recorded in stats, so a stale
+    journal left by an interrupted compaction is ignored.
+
+    Returns:
+        int: Number of events applied.
+    """
+    skills = stats.setdefault("skills", {})
+    count = 0
+    try:
+        with open(journal_path(stats_path, stats.get("journalGen", 0)), encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                    name, today = event["n"], event["t"]
+                except (ValueError, KeyError, TypeError):
+                    continue  # torn or foreign line
+                entry = skills.get(name)
+                if entry is None:
+                    entry = skills[name] = {"uses": 0, "lastUsed": None, "pinned": False}
+                entry["uses"] = entry.get("uses", 0) + 1
+                entry["lastUsed"] = today
+                stats["totalUses"] = stats.get("totalUses", 0) + 1
+                stats["lastUpdated"] = today
+                count += 1
+    except OSError:
+        pass
+    return count
+
+
+def append_event(stats_path, name, today, gen=0):
+    """Append one increment event to the journal of generation gen.
+
+    The record is a single short line written with one O_APPEND write(),
+    so concurrent writers never interleave partial records.
+
+    Returns:
+        tuple: The journal's (st_mtime_ns, st_size) after the write.
+    """
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    line = json.dumps({"n": name, "t": today}, ensure_ascii=False, separators=(",", ":"))
+    fd = os.open(
+        str(journal_path(stats_path, gen)),
+        os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+        0o600,
+    )
+    try:
+        os.write(fd, (line + "\n").encode("utf-8"))
+        st = os.fstat(fd)
+    finally:
+        os.close(fd)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def compact(stats_path, stats, encode):
+    """Fold the journal into the stats file and retire it.
+
+    stats must already include every journaled event; encode(stats) returns
+    the file's bytes. The generation is bumped and the stats file written
+    (0600) before the old journal is removed, so a crash in between leaves
+    an orphaned journal that is ignored rather than replayed twice.
+    """
+    old_gen = stats.get("journalGen", 0)
+    stats["journalGen"] = old_gen + 1
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(stats_path, encode(stats))
+    try:
+        os.unlink(journal_path(stats_path, old_gen))
+    except OSError:
+        pass
+
+
+def lock_stats(stats_path):
+    """Take an exclusive lock on the sibling <stats>.lock file; return its fd."""
+    stats_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(stats_path.with_suffix(".lock")), os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            import msvcrt
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+
+def unlock_stats(fd):
+    """Release a lock taken by lock_stats and close its fd."""
+    try:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            import msvcrt
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _fsync_dir(path):
+    """Flush a directory entry change (e.g. a rename) to disk, where supported."""
+    try:
+        dir_fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass  # Not supported for directories on this platform
+    finally:
+        os.close(dir_fd)
+
+
+def write_atomic(path, data, mode=0o600):
+    """Replace the file at path with the bytes data, atomically and durably.
+
+    The bytes go to a sibling temp file created with O_EXCL under a
+    pid/counter name, so concurrent writers never share one. It is fsynced
+    and renamed over path, and the directory is fsynced after the rename;
+    on failure the temp file is removed. The file gets the given mode bits,
+    or the default 0666 & ~umask when mode is None.
+    """
+    path = str(path)
+    directory, name = os.path.split(path)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_CLOEXEC", 0)
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.getpid()}-{next(_TMP_COUNTER)}.tmp")
+        try:
+            fd = os.open(tmp_path, flags, 0o666 if mode is None else mode)
+            break
+        except FileExistsError:
+            continue  # Stale leftover; try the next name
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if mode is not None:
+            os.chmod(tmp_path, mode)  # Not narrowed by the umask
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory or ".")